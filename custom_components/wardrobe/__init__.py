@@ -10,7 +10,10 @@ import voluptuous as vol
 from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY, ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ALL_STATES,
@@ -43,10 +46,12 @@ from .const import (
 )
 from .coordinator import WardrobeCoordinator
 
-__all__ = ["async_setup_entry", "async_unload_entry", "async_remove_entry"]
+__all__ = ["async_setup", "async_setup_entry", "async_unload_entry", "async_remove_entry"]
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
 _BULK_SET_STATE_SCHEMA = vol.Schema(
     {
@@ -87,6 +92,98 @@ def _item_entries(hass: HomeAssistant) -> list[ConfigEntry]:
     return [e for e in hass.config_entries.async_entries(DOMAIN) if not _is_hub(e)]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the domain services once for the lifetime of the process.
+
+    The handlers resolve the shared coordinator lazily at call time, so
+    they survive entry reloads without any per-entry (de)registration.
+    """
+
+    def _shared_coordinator() -> WardrobeCoordinator:
+        shared = hass.data.get(DOMAIN, {}).get("shared")
+        if shared is None:
+            raise HomeAssistantError("No wardrobe items are set up")
+        return shared["coordinator"]
+
+    async def _async_bulk_set_state(call: ServiceCall) -> None:
+        coordinator = _shared_coordinator()
+        new_state = call.data[ATTR_NEW_STATE]
+        cat_filter = call.data.get(ATTR_FILTER_CATEGORY)
+        lt_filter = call.data.get(ATTR_FILTER_LAUNDRY_TYPE)
+        cur_filter = call.data.get(ATTR_FILTER_CURRENT_STATE)
+
+        matched = 0
+        # One listener notification for the whole batch, not one per item.
+        with coordinator.deferred_updates():
+            for entry in _item_entries(hass):
+                if is_bulk_entry(entry.data):
+                    continue  # bulk items have no state machine
+                if cat_filter and entry.data.get(CONF_CATEGORY) != cat_filter:
+                    continue
+                if lt_filter and entry.data.get(CONF_LAUNDRY_TYPE) != lt_filter:
+                    continue
+                if (
+                    cur_filter
+                    and coordinator.get_state(entry.entry_id) != cur_filter
+                ):
+                    continue
+                await coordinator.async_set_state(entry.entry_id, new_state)
+                matched += 1
+
+        _LOGGER.info(
+            "wardrobe.bulk_set_state: %d items → %s (cat=%s lt=%s cur=%s)",
+            matched,
+            new_state,
+            cat_filter,
+            lt_filter,
+            cur_filter,
+        )
+
+    async def _async_wash_load(call: ServiceCall) -> None:
+        """Complete a wash: every dirty item (optionally one laundry type) → clean."""
+        coordinator = _shared_coordinator()
+        lt_filter = call.data.get(ATTR_FILTER_LAUNDRY_TYPE)
+
+        washed: list[str] = []
+        # One listener notification for the whole batch, not one per item.
+        with coordinator.deferred_updates():
+            for entry in _item_entries(hass):
+                if lt_filter and entry.data.get(CONF_LAUNDRY_TYPE) != lt_filter:
+                    continue
+                if is_bulk_entry(entry.data):
+                    if await coordinator.async_bulk_mark_washed(entry.entry_id):
+                        washed.append(
+                            entry.data.get(CONF_ITEM_NAME, entry.entry_id)
+                        )
+                    continue
+                if coordinator.get_state(entry.entry_id) not in DIRTY_STATES:
+                    continue
+                await coordinator.async_mark_washed(entry.entry_id)
+                washed.append(entry.data.get(CONF_ITEM_NAME, entry.entry_id))
+
+        hass.bus.async_fire(
+            EVENT_WASH_COMPLETED,
+            {
+                ATTR_FILTER_LAUNDRY_TYPE: lt_filter,
+                "count": len(washed),
+                ATTR_ITEMS: sorted(washed),
+            },
+        )
+        _LOGGER.info(
+            "wardrobe.wash_load: washed %d items (laundry_type=%s)",
+            len(washed),
+            lt_filter,
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_BULK_SET_STATE, _async_bulk_set_state, _BULK_SET_STATE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_WASH_LOAD, _async_wash_load, _WASH_LOAD_SCHEMA
+    )
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up either a single wardrobe item or the summary hub."""
     shared = await _ensure_shared(hass)
@@ -99,6 +196,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator: WardrobeCoordinator = shared["coordinator"]
     await coordinator.async_ensure_entry(entry.entry_id)
+
+    tag_id = entry.data.get(CONF_NFC_TAG_ID)
+    if tag_id:
+        shared["tag_index"][tag_id] = entry.entry_id
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
@@ -124,12 +226,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return True
 
     shared["entry_ids"].discard(entry.entry_id)
+    # Drop by value, not by the current tag: an options edit updates
+    # entry.data before the reload unloads us, so the old tag may differ.
+    tag_index: dict[str, str] = shared["tag_index"]
+    for tag_id in [t for t, eid in tag_index.items() if eid == entry.entry_id]:
+        del tag_index[tag_id]
     if not shared["entry_ids"]:
         unsub = shared.get("unsub_tag_listener")
         if unsub is not None:
             unsub()
-        for service in (SERVICE_BULK_SET_STATE, SERVICE_WASH_LOAD):
-            hass.services.async_remove(DOMAIN, service)
+        # The delayed save lives on the store instance about to be dropped;
+        # flush it so nothing from the last window is lost (and no orphaned
+        # timer outlives the coordinator).
+        coordinator: WardrobeCoordinator = shared["coordinator"]
+        await coordinator.async_flush()
         hass.data[DOMAIN].pop("shared", None)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
@@ -158,7 +268,7 @@ async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
 
 async def _ensure_shared(hass: HomeAssistant) -> dict[str, Any]:
-    """Create (or return) the shared coordinator, tag listener and services."""
+    """Create (or return) the shared coordinator and tag listener."""
     bucket = hass.data.setdefault(DOMAIN, {})
     if "shared" in bucket:
         return bucket["shared"]
@@ -169,14 +279,29 @@ async def _ensure_shared(hass: HomeAssistant) -> dict[str, Any]:
     shared: dict[str, Any] = {
         "coordinator": coordinator,
         "entry_ids": set(),
+        # Reverse index nfc_tag_id -> entry_id, maintained by entry
+        # setup/unload, so scans resolve in O(1) instead of walking entries.
+        "tag_index": {},
     }
 
+    # The entity registry is a process-wide singleton; resolve it once here
+    # instead of on every matched scan.
+    entity_registry = er.async_get(hass)
+
     def _state_entity_id(entry_id: str) -> str | None:
         """Resolve an item's state-select entity id, if it is registered."""
-        return er.async_get(hass).async_get_entity_id(
+        return entity_registry.async_get_entity_id(
             "select", DOMAIN, f"{DOMAIN}_{entry_id}_state"
         )
 
+    # Built once with the listener: per scan the configured action becomes a
+    # single dict lookup instead of an if/elif chain over enum values.
+    scan_handlers = {
+        ScanAction.MARK_WORN.value: coordinator.async_mark_worn,
+        ScanAction.MARK_WASHED.value: coordinator.async_mark_washed,
+        ScanAction.CYCLE.value: coordinator.async_cycle_state,
+    }
+
     async def _handle_scan(entry: ConfigEntry, device_id: str | None) -> None:
         # Announce the scan first so front-ends can focus/open the item
         # regardless of whether the scan also mutates state.
@@ -193,95 +318,38 @@ async def _ensure_shared(hass: HomeAssistant) -> dict[str, Any]:
         action = entry.data.get(CONF_SCAN_ACTION, DEFAULT_SCAN_ACTION)
         if action == ScanAction.OPEN.value:
             return  # focus-only: the front-end drives everything from here
-        if action == ScanAction.MARK_WORN.value:
-            await coordinator.async_mark_worn(entry.entry_id)
-        elif action == ScanAction.MARK_WASHED.value:
-            await coordinator.async_mark_washed(entry.entry_id)
-        else:
-            await coordinator.async_cycle_state(entry.entry_id)
+        # Unknown actions fall back to cycling, as before.
+        await scan_handlers.get(action, coordinator.async_cycle_state)(entry.entry_id)
 
     @callback
     def _on_tag_scanned(event: Event) -> None:
-        tag_id = event.data.get("tag_id")
-        if not tag_id:
+        # Matched scans are the common case: index straight into the tag
+        # index and treat a missing/unknown tag as the rare slow path.
+        try:
+            entry_id = shared["tag_index"][event.data["tag_id"]]
+        except KeyError:
+            _LOGGER.debug(
+                "Ignoring tag scan with no matching wardrobe item: %s",
+                event.data.get("tag_id"),
+            )
             return
-        device_id = event.data.get("device_id")
-        for entry in _item_entries(hass):
-            if entry.data.get(CONF_NFC_TAG_ID) == tag_id:
-                hass.async_create_task(_handle_scan(entry, device_id))
-                return
-        _LOGGER.debug("Ignoring tag scan with no matching wardrobe item: %s", tag_id)
-
-    shared["unsub_tag_listener"] = hass.bus.async_listen(
-        EVENT_TAG_SCANNED, _on_tag_scanned
-    )
-
-    async def _async_bulk_set_state(call: ServiceCall) -> None:
-        new_state = call.data[ATTR_NEW_STATE]
-        cat_filter = call.data.get(ATTR_FILTER_CATEGORY)
-        lt_filter = call.data.get(ATTR_FILTER_LAUNDRY_TYPE)
-        cur_filter = call.data.get(ATTR_FILTER_CURRENT_STATE)
-
-        matched = 0
-        for entry in _item_entries(hass):
-            if is_bulk_entry(entry.data):
-                continue  # bulk items have no state machine
-            if cat_filter and entry.data.get(CONF_CATEGORY) != cat_filter:
-                continue
-            if lt_filter and entry.data.get(CONF_LAUNDRY_TYPE) != lt_filter:
-                continue
-            if cur_filter and coordinator.get_state(entry.entry_id) != cur_filter:
-                continue
-            await coordinator.async_set_state(entry.entry_id, new_state)
-            matched += 1
-
-        _LOGGER.info(
-            "wardrobe.bulk_set_state: %d items → %s (cat=%s lt=%s cur=%s)",
-            matched,
-            new_state,
-            cat_filter,
-            lt_filter,
-            cur_filter,
-        )
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is not None:
+            hass.async_create_task(_handle_scan(entry, event.data.get("device_id")))
 
-    async def _async_wash_load(call: ServiceCall) -> None:
-        """Complete a wash: every dirty item (optionally one laundry type) → clean."""
-        lt_filter = call.data.get(ATTR_FILTER_LAUNDRY_TYPE)
+    @callback
+    def _tag_event_filter(event_or_data: Any) -> bool:
+        """Drop scans for tags we don't track before a listener run is queued.
 
-        washed: list[str] = []
-        for entry in _item_entries(hass):
-            if lt_filter and entry.data.get(CONF_LAUNDRY_TYPE) != lt_filter:
-                continue
-            if is_bulk_entry(entry.data):
-                if await coordinator.async_bulk_mark_washed(entry.entry_id):
-                    washed.append(entry.data.get(CONF_ITEM_NAME, entry.entry_id))
-                continue
-            if coordinator.get_state(entry.entry_id) not in DIRTY_STATES:
-                continue
-            await coordinator.async_mark_washed(entry.entry_id)
-            washed.append(entry.data.get(CONF_ITEM_NAME, entry.entry_id))
+        2024.3 hands bus filters the full Event; newer cores hand them just
+        ``event.data`` — unwrap either shape.
+        """
+        data = getattr(event_or_data, "data", event_or_data)
+        return data.get("tag_id") in shared["tag_index"]
 
-        hass.bus.async_fire(
-            EVENT_WASH_COMPLETED,
-            {
-                ATTR_FILTER_LAUNDRY_TYPE: lt_filter,
-                "count": len(washed),
-                ATTR_ITEMS: sorted(washed),
-            },
-        )
-        _LOGGER.info(
-            "wardrobe.wash_load: washed %d items (laundry_type=%s)",
-            len(washed),
-            lt_filter,
-        )
-
-    hass.services.async_register(
-        DOMAIN, SERVICE_BULK_SET_STATE, _async_bulk_set_state, _BULK_SET_STATE_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_WASH_LOAD, _async_wash_load, _WASH_LOAD_SCHEMA
+    shared["unsub_tag_listener"] = hass.bus.async_listen(
+        EVENT_TAG_SCANNED, _on_tag_scanned, event_filter=_tag_event_filter
     )
-    shared["wash_load"] = _async_wash_load
 
     bucket["shared"] = shared
     return shared
@@ -19,7 +19,6 @@ from .const import (
     ATTR_WEARS_SINCE_WASH,
     CONF_KIND,
     CONF_LOAD_SIZE,
-    DIRTY_STATES,
     DOMAIN,
     KIND_SUMMARY,
     LAUNDRY_TYPES,
@@ -65,13 +64,7 @@ class NeedsWashingBinarySensor(WardrobeItemEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """True when the threshold is reached and the item isn't queued yet."""
-        threshold = self.coordinator.get_threshold(self._entry.entry_id)
-        if threshold <= 0:
-            return False
-        rec = self.coordinator.data.get(self._entry.entry_id)
-        if rec is None or rec["state"] in DIRTY_STATES:
-            return False
-        return int(rec["wears_since_wash"]) >= threshold
+        return self.coordinator.needs_washing(self._entry.entry_id)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
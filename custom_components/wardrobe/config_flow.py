@@ -164,6 +164,19 @@ def _details_schema() -> dict[vol.Marker, Any]:
     }
 
 
+# The step schemas are static — compile them once at import time instead of
+# rebuilding selectors and markers on every form render.
+_USER_SCHEMA = vol.Schema(_basics_schema(include_mode=True))
+_BULK_STEP_SCHEMA = vol.Schema(_bulk_schema())
+_TRACKING_CREATE_SCHEMA = vol.Schema(_tracking_schema(include_seeded=True))
+_TRACKING_EDIT_SCHEMA = vol.Schema(_tracking_schema(include_seeded=False))
+_DETAILS_SCHEMA = vol.Schema(_details_schema())
+
+_LOAD_SIZE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=0.5, max=100, step=0.5, mode=NumberSelectorMode.BOX)
+)
+
+
 def _clean_details(user_input: dict[str, Any]) -> dict[str, Any]:
     """Normalize the details step: strip text fields, drop empties."""
     out: dict[str, Any] = {}
@@ -226,7 +239,7 @@ class WardrobeConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(_basics_schema(include_mode=True)), user_input
+                _USER_SCHEMA, user_input
             ),
             errors=errors,
         )
@@ -257,7 +270,7 @@ class WardrobeConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="bulk",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(_bulk_schema()), user_input
+                _BULK_STEP_SCHEMA, user_input
             ),
         )
 
@@ -292,7 +305,7 @@ class WardrobeConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="tracking",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(_tracking_schema(include_seeded=True)), user_input
+                _TRACKING_CREATE_SCHEMA, user_input
             ),
             errors=errors,
         )
@@ -308,7 +321,7 @@ class WardrobeConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         return self.async_show_form(
-            step_id="details", data_schema=vol.Schema(_details_schema())
+            step_id="details", data_schema=_DETAILS_SCHEMA
         )
 
     async def async_step_integration_discovery(
@@ -427,7 +440,7 @@ class WardrobeOptionsFlow(OptionsFlow):
         return self.async_show_form(
             step_id="tracking",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(_tracking_schema(include_seeded=False)),
+                _TRACKING_EDIT_SCHEMA,
                 user_input or current,
             ),
             errors=errors,
@@ -469,7 +482,7 @@ class WardrobeOptionsFlow(OptionsFlow):
         return self.async_show_form(
             step_id="details",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(_details_schema()), current
+                _DETAILS_SCHEMA, current
             ),
         )
 
@@ -506,18 +519,15 @@ class WardrobeHubOptionsFlow(OptionsFlow):
                     data[load_size_key(lt)] = float(value)
             return self.async_create_entry(title="", data=data)
 
-        threshold_selector = NumberSelector(
-            NumberSelectorConfig(min=0.5, max=100, step=0.5, mode=NumberSelectorMode.BOX)
-        )
         schema: dict[vol.Marker, Any] = {
             vol.Required(
                 CONF_LOAD_SIZE,
                 default=self._entry.options.get(CONF_LOAD_SIZE, DEFAULT_LOAD_SIZE),
-            ): threshold_selector
+            ): _LOAD_SIZE_SELECTOR
         }
         current: dict[str, Any] = {}
         for lt in LAUNDRY_TYPES:
-            schema[vol.Optional(load_size_key(lt))] = threshold_selector
+            schema[vol.Optional(load_size_key(lt))] = _LOAD_SIZE_SELECTOR
             if load_size_key(lt) in self._entry.options:
                 current[load_size_key(lt)] = self._entry.options[load_size_key(lt)]
         return self.async_show_form(
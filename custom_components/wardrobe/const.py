@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, Final
 
 from homeassistant.const import Platform
@@ -28,6 +29,8 @@ HUB_PLATFORMS: Final = [
 
 STORAGE_KEY: Final = "wardrobe_states"
 STORAGE_VERSION: Final = 4
+# Seconds to coalesce storage writes; a burst of scans becomes one write.
+STORAGE_SAVE_DELAY: Final = 10
 
 # ---------------------------------------------------------------------------
 # ConfigEntry data keys
@@ -179,6 +182,10 @@ EXTRA_STATES: Final[list[str]] = PIPELINE_STATES + PARKED_STATES
 
 ALL_STATES: Final[list[str]] = CORE_CYCLE + PIPELINE_STATES + PARKED_STATES
 
+# Frozenset twin of ALL_STATES for O(1) membership tests on hot validation
+# paths; the list keeps its canonical order for schemas and UI options.
+ALL_STATES_SET: Final[frozenset[str]] = frozenset(ALL_STATES)
+
 # States meaning "this item is dirty / being washed". Transitioning from one
 # of these into clean counts as a completed wash.
 DIRTY_STATES: Final[frozenset[str]] = frozenset(
@@ -214,12 +221,50 @@ def next_state_in(cycle: list[str], current: str) -> str:
     return cycle[(idx + 1) % len(cycle)]
 
 
+@lru_cache(maxsize=None)
+def _next_state_map(extras_key: tuple[str, ...]) -> Mapping[str, str]:
+    """Build the state→successor map for one enabled-pipeline combination.
+
+    There are only a handful of combinations (2^3 pipeline subsets), so the
+    cache stays tiny while the per-call ``list.index`` scan disappears.
+    """
+    cycle = build_cycle(list(extras_key))
+    return {state: cycle[(i + 1) % len(cycle)] for i, state in enumerate(cycle)}
+
+
+def next_state_for(extra_states: list[str] | None, current: str) -> str:
+    """Cached O(1) equivalent of ``next_state_in(build_cycle(...), current)``.
+
+    Out-of-cycle states (parked, or pipeline states disabled after entry)
+    resolve to clean, exactly as in ``next_state_in``.
+    """
+    extras = set(extra_states or [])
+    key = tuple(s for s in PIPELINE_STATES if s in extras)
+    return _next_state_map(key).get(current, DEFAULT_STATE)
+
+
 def selectable_states(extra_states: list[str] | None = None) -> list[str]:
     """Return the states offered by an item's select entity."""
     extras = set(extra_states or [])
     return build_cycle(extra_states) + [s for s in PARKED_STATES if s in extras]
 
 
+@lru_cache(maxsize=None)
+def _selectable_options(extras_key: tuple[str, ...]) -> list[str]:
+    return selectable_states(list(extras_key))
+
+
+def selectable_options(extra_states: list[str] | None) -> list[str]:
+    """Cached ``selectable_states`` for the select entity's options property.
+
+    One list per extra-states combination is shared across all items and
+    reads; callers must treat it as frozen.
+    """
+    extras = set(extra_states or [])
+    key = tuple(s for s in EXTRA_STATES if s in extras)
+    return _selectable_options(key)
+
+
 # ---------------------------------------------------------------------------
 # Scan actions
 # ---------------------------------------------------------------------------
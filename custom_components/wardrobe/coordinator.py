@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, TypedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Final, TypedDict
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
     ALL_STATES,
+    ALL_STATES_SET,
     ATTR_LAST_WASHED_AT,
     ATTR_LAST_WORN_AT,
     ATTR_STATE_CHANGED_AT,
@@ -35,19 +39,48 @@ from .const import (
     EVENT_NEEDS_WASH,
     EVENT_STATE_CHANGED,
     KIND_SUMMARY,
+    LAUNDRY_TYPES,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
     WardrobeState,
-    build_cycle,
     is_bulk_entry,
-    next_state_in,
+    next_state_for,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Hot-path state strings hoisted once. WardrobeState is a StrEnum, but
+# ``.value`` is still an enum attribute walk on every comparison; the
+# mutation paths below compare against these on each scan.
+_STATE_WORN: Final[str] = WardrobeState.WORN.value
+_STATE_LAUNDRY: Final[str] = WardrobeState.LAUNDRY.value
+
+# Last (millisecond, iso-string) pair produced by _utcnow_iso.
+_last_now_iso: tuple[int, str] = (0, "")
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as an ISO string, cached per millisecond.
+
+    Bulk services stamp many records back to back in the same tick;
+    formatting the identical string once instead of per record keeps the
+    burst path allocation-free.
+    """
+    global _last_now_iso
+    now = dt_util.utcnow()
+    key = int(now.timestamp() * 1000)
+    if key != _last_now_iso[0]:
+        _last_now_iso = (key, now.isoformat())
+    return _last_now_iso[1]
+
 
 class WardrobeRecord(TypedDict):
-    """Per-entry state persisted in storage."""
+    """Per-entry state persisted in storage.
+
+    Deliberately a fixed set of scalar fields — no per-wash history lists —
+    so a record never grows with use and every save/encode stays O(items).
+    """
 
     state: str
     wears_since_wash: int
@@ -92,7 +125,7 @@ def _coerce_record(value: Any) -> WardrobeRecord:
     base = _new_record()
     if isinstance(value, dict):
         state = value.get("state", DEFAULT_STATE)
-        if state not in ALL_STATES:
+        if state not in ALL_STATES_SET:
             state = DEFAULT_STATE
         base["state"] = state
         for key in ("wears_since_wash", "wear_count_total", "wash_count"):
@@ -136,7 +169,7 @@ class WardrobeStore(Store[dict[str, Any]]):
             entries_new: dict[str, WardrobeRecord] = {}
             for entry_id, value in entries_old.items():
                 if isinstance(value, str):
-                    if value not in ALL_STATES:
+                    if value not in ALL_STATES_SET:
                         _LOGGER.warning(
                             "Migrating unknown wardrobe state %r for %s → %s",
                             value,
@@ -164,6 +197,45 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         super().__init__(hass, _LOGGER, name=DOMAIN)
         self._store: WardrobeStore = WardrobeStore(hass, STORAGE_VERSION, STORAGE_KEY)
         self.data: dict[str, WardrobeRecord] = {}
+        # Per-update caches; every hub sensor reads them, so one pass over
+        # the items serves all of them until the next data change.
+        self._loads_by_type: dict[str, tuple[list[str], int, float]] | None = None
+        self._item_entries_cache: list[tuple[ConfigEntry, WardrobeRecord]] | None = None
+        self._defer_notify = False
+        self._notify_pending = False
+
+    @callback
+    def _drop_derived_caches(self) -> None:
+        """Invalidate everything derived from the current data/config."""
+        self._loads_by_type = None
+        self._item_entries_cache = None
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, WardrobeRecord]) -> None:
+        """Notify listeners, dropping caches derived from the previous data."""
+        self._drop_derived_caches()
+        if self._defer_notify:
+            self._notify_pending = True
+            return
+        super().async_set_updated_data(data)
+
+    @contextmanager
+    def deferred_updates(self) -> Iterator[None]:
+        """Coalesce listener notifications across a batch of mutations.
+
+        Bulk operations touch many records back to back; each mutation would
+        otherwise wake every CoordinatorEntity. Inside this context the
+        notifications are held back and a single one goes out on exit, if
+        any mutation asked for one.
+        """
+        self._defer_notify = True
+        try:
+            yield
+        finally:
+            self._defer_notify = False
+            if self._notify_pending:
+                self._notify_pending = False
+                self.async_set_updated_data(self.data)
 
     # ------------------------------------------------------------------
     # Persistence
@@ -179,17 +251,43 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
             self.data = {
                 entry_id: _coerce_record(rec) for entry_id, rec in entries.items()
             }
-        self.async_set_updated_data(self.data)
+        # No listener notification here: entities only attach after setup,
+        # so there is nobody to fan out to yet.
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the payload handed to the store on (delayed) saves."""
+        return {"entries": self.data}
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Queue a storage write, coalescing bursts of mutations.
 
-    async def _async_save(self) -> None:
-        """Persist the current state to storage."""
+        Saving on every mutation meant one full disk write per scan; the
+        store now writes at most once per delay window and flushes any
+        pending write at shutdown. The store JSON-encodes and writes in an
+        executor thread, so flushes never block the event loop.
+        """
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write any pending delayed save to disk immediately.
+
+        Called when the shared coordinator is torn down: a delayed save is
+        held on the store instance, so dropping the coordinator without a
+        flush would lose the last window of mutations (and leave an orphaned
+        delay timer to clobber a re-created store later). ``async_save``
+        also cancels the pending timer.
+        """
         try:
-            await self._store.async_save({"entries": self.data})
+            await self._store.async_save(self._data_to_save())
         except Exception:
             _LOGGER.error("Failed to save wardrobe state", exc_info=True)
 
     async def async_ensure_entry(self, entry_id: str) -> None:
         """Seed an entry's record, syncing seeded fields from config on first run."""
+        # An entry (re-)setup can mean its config changed (laundry type,
+        # name) without touching any record, so the derived caches must go.
+        self._drop_derived_caches()
         rec = self.data.get(entry_id)
         if rec is None:
             self.data[entry_id] = _new_record(
@@ -207,14 +305,19 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
                 changed = True
             if not changed:
                 return
-        await self._async_save()
+        self._schedule_save()
         self.async_set_updated_data(self.data)
 
     async def async_remove_entry(self, entry_id: str) -> None:
         """Drop an entry's record from storage when its ConfigEntry is removed."""
         if entry_id in self.data:
             del self.data[entry_id]
-            await self._async_save()
+            # Removal must hit disk immediately: the caller may hold a
+            # throwaway coordinator with nothing alive to flush a delayed write.
+            try:
+                await self._store.async_save(self._data_to_save())
+            except Exception:
+                _LOGGER.error("Failed to save wardrobe state", exc_info=True)
             self.async_set_updated_data(self.data)
 
     # ------------------------------------------------------------------
@@ -236,7 +339,13 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
     def get_threshold(self, entry_id: str) -> int:
         """Return the effective wear threshold for an entry (0 = disabled)."""
         rec = self.data.get(entry_id)
-        if rec is not None and rec["wear_threshold"] is not None:
+        if rec is None:
+            return self._config_threshold(entry_id)
+        return self._threshold_of(entry_id, rec)
+
+    def _threshold_of(self, entry_id: str, rec: WardrobeRecord) -> int:
+        """Resolve the effective threshold from a record already in hand."""
+        if rec["wear_threshold"] is not None:
             return int(rec["wear_threshold"])
         return self._config_threshold(entry_id)
 
@@ -253,42 +362,84 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         dirty = 0 if rec is None else int(rec["dirty_count"])
         return max(0, self._config_quantity(entry_id) - dirty)
 
+    def item_entries(self) -> list[tuple[ConfigEntry, WardrobeRecord]]:
+        """Return (ConfigEntry, record) pairs for every tracked item.
+
+        Cached per data update: the hub sensors all enumerate the same
+        pairs, so the config-entry lookups run once per change instead of
+        once per sensor per state write.
+        """
+        pairs = self._item_entries_cache
+        if pairs is None:
+            get_entry = self.hass.config_entries.async_get_entry
+            pairs = self._item_entries_cache = [
+                (entry, rec)
+                for entry_id, rec in self.data.items()
+                if (entry := get_entry(entry_id)) is not None
+                and entry.data.get(CONF_KIND) != KIND_SUMMARY
+            ]
+        return pairs
+
+    def needs_washing(self, entry_id: str) -> bool:
+        """Return True when an item hit its threshold and isn't queued yet.
+
+        Single source of the rule shared by the per-item binary sensor and
+        the hub's needs-wash count.
+        """
+        rec = self.data.get(entry_id)
+        if rec is None or rec["state"] in DIRTY_STATES:
+            return False
+        threshold = self._threshold_of(entry_id, rec)
+        return threshold > 0 and int(rec["wears_since_wash"]) >= threshold
+
     def load_for_type(self, laundry_type: str) -> tuple[list[str], int, float]:
         """Return ``(names, units, total_weight)`` waiting for a laundry type.
 
         Individual items in ``laundry`` contribute one unit of their weight;
         bulk items contribute ``dirty_count`` units of theirs (named once).
+        Loads for every type are computed in one pass and cached until the
+        next data update, since each hub load entity asks for its own type.
         """
-        names: list[str] = []
-        units = 0
-        total_weight = 0.0
-        for entry_id, rec in self.data.items():
-            entry = self.hass.config_entries.async_get_entry(entry_id)
-            if entry is None or entry.data.get(CONF_KIND) == KIND_SUMMARY:
-                continue
-            if (
-                entry.data.get(CONF_LAUNDRY_TYPE, DEFAULT_LAUNDRY_TYPE)
-                != laundry_type
-            ):
-                continue
+        loads = self._loads_by_type
+        if loads is None:
+            loads = self._loads_by_type = self._compute_loads()
+        return loads.get(laundry_type, ([], 0, 0.0))
+
+    def _compute_loads(self) -> dict[str, tuple[list[str], int, float]]:
+        """Build the laundry-load aggregates for all types in a single pass."""
+        names: dict[str, list[str]] = {lt: [] for lt in LAUNDRY_TYPES}
+        units: dict[str, int] = dict.fromkeys(LAUNDRY_TYPES, 0)
+        weights: dict[str, float] = dict.fromkeys(LAUNDRY_TYPES, 0.0)
+        for entry, rec in self.item_entries():
+            entry_id = entry.entry_id
+            lt = entry.data.get(CONF_LAUNDRY_TYPE, DEFAULT_LAUNDRY_TYPE)
             if is_bulk_entry(entry.data):
                 dirty = int(rec["dirty_count"])
                 if dirty <= 0:
                     continue
-                names.append(entry.data.get(CONF_ITEM_NAME, entry_id))
-                units += dirty
-                total_weight += dirty * self.get_weight(entry_id)
+                names.setdefault(lt, []).append(
+                    entry.data.get(CONF_ITEM_NAME, entry_id)
+                )
+                units[lt] = units.get(lt, 0) + dirty
+                weights[lt] = weights.get(lt, 0.0) + dirty * self.get_weight(
+                    entry_id
+                )
             else:
-                if rec["state"] != WardrobeState.LAUNDRY.value:
+                if rec["state"] != _STATE_LAUNDRY:
                     continue
-                names.append(entry.data.get(CONF_ITEM_NAME, entry_id))
-                units += 1
-                total_weight += self.get_weight(entry_id)
-        return sorted(names), units, total_weight
+                names.setdefault(lt, []).append(
+                    entry.data.get(CONF_ITEM_NAME, entry_id)
+                )
+                units[lt] = units.get(lt, 0) + 1
+                weights[lt] = weights.get(lt, 0.0) + self.get_weight(entry_id)
+        return {
+            lt: (sorted(lt_names), units[lt], weights[lt])
+            for lt, lt_names in names.items()
+        }
 
     def count_by_state(self) -> dict[str, int]:
         """Return a map of state → number of entries currently in that state."""
-        counts = {s: 0 for s in ALL_STATES}
+        counts = dict.fromkeys(ALL_STATES, 0)
         for rec in self.data.values():
             counts[rec["state"]] = counts.get(rec["state"], 0) + 1
         return counts
@@ -314,16 +465,26 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
             return 1
         return max(1, int(entry.data.get(CONF_QUANTITY, 1) or 1))
 
+    def _record_for(self, entry_id: str) -> WardrobeRecord:
+        """Return the live record for an entry, creating defaults if missing.
+
+        Mutation methods edit this record in place; copying every record on
+        every write only re-allocated data the save path reads as-is.
+        """
+        rec = self.data.get(entry_id)
+        if rec is None:
+            rec = self.data[entry_id] = _new_record()
+        return rec
+
     def _is_bulk(self, entry_id: str) -> bool:
         """Return True when the entry is a bulk (counter-tracked) item."""
         entry = self.hass.config_entries.async_get_entry(entry_id)
         return entry is not None and is_bulk_entry(entry.data)
 
-    def _cycle_for(self, entry_id: str) -> list[str]:
-        """Return the state cycle for an entry, honoring its extra states."""
+    def _extras_for(self, entry_id: str) -> list[str] | None:
+        """Return the extra states configured on an entry."""
         entry = self.hass.config_entries.async_get_entry(entry_id)
-        extras = entry.data.get(CONF_EXTRA_STATES) if entry is not None else None
-        return build_cycle(extras)
+        return entry.data.get(CONF_EXTRA_STATES) if entry is not None else None
 
     def _item_name(self, entry_id: str) -> str | None:
         entry = self.hass.config_entries.async_get_entry(entry_id)
@@ -335,18 +496,22 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
 
     async def async_set_threshold(self, entry_id: str, value: int) -> None:
         """Set the runtime wear threshold for an entry (0 disables it)."""
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
-        rec["wear_threshold"] = max(0, int(value))
-        self.data[entry_id] = rec  # type: ignore[assignment]
-        await self._async_save()
+        value = max(0, int(value))
+        rec = self._record_for(entry_id)
+        if rec["wear_threshold"] == value:
+            return  # no-op write: skip the save and listener fan-out
+        rec["wear_threshold"] = value
+        self._schedule_save()
         self.async_set_updated_data(self.data)
 
     async def async_set_weight(self, entry_id: str, value: float) -> None:
         """Set the runtime per-unit load weight for an entry."""
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
-        rec["weight"] = max(0.1, float(value))
-        self.data[entry_id] = rec  # type: ignore[assignment]
-        await self._async_save()
+        value = max(0.1, float(value))
+        rec = self._record_for(entry_id)
+        if rec["weight"] == value:
+            return  # no-op write: skip the save and listener fan-out
+        rec["weight"] = value
+        self._schedule_save()
         self.async_set_updated_data(self.data)
 
     async def async_set_clean_remaining(self, entry_id: str, value: int) -> None:
@@ -358,7 +523,7 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         without wash accounting). No events fire either way.
         """
         quantity = self._config_quantity(entry_id)
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
+        rec = self._record_for(entry_id)
         old_dirty = int(rec["dirty_count"])
         new_clean = min(max(0, int(value)), quantity)
         new_dirty = quantity - new_clean
@@ -367,10 +532,9 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         if new_dirty > old_dirty:
             worn = new_dirty - old_dirty
             rec["wear_count_total"] = int(rec["wear_count_total"]) + worn
-            rec["last_worn_at"] = dt_util.utcnow().isoformat()
+            rec["last_worn_at"] = _utcnow_iso()
         rec["dirty_count"] = new_dirty
-        self.data[entry_id] = rec  # type: ignore[assignment]
-        await self._async_save()
+        self._schedule_save()
         self.async_set_updated_data(self.data)
 
     async def async_bulk_wear_one(self, entry_id: str) -> None:
@@ -381,14 +545,13 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
 
     async def async_bulk_mark_washed(self, entry_id: str) -> bool:
         """Wash a bulk item's dirty units. Returns True if anything was dirty."""
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
+        rec = self._record_for(entry_id)
         if int(rec["dirty_count"]) <= 0:
             return False
         rec["dirty_count"] = 0
         rec["wash_count"] = int(rec["wash_count"]) + 1
-        rec["last_washed_at"] = dt_util.utcnow().isoformat()
-        self.data[entry_id] = rec  # type: ignore[assignment]
-        await self._async_save()
+        rec["last_washed_at"] = _utcnow_iso()
+        self._schedule_save()
         self.async_set_updated_data(self.data)
         return True
 
@@ -399,23 +562,25 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         - Entering ``clean`` from a dirty state (laundry/washing/drying/
           ironing) counts a completed wash and resets ``wears_since_wash``.
         """
-        if new_state not in ALL_STATES:
+        if new_state not in ALL_STATES_SET:
             raise ValueError(f"Invalid wardrobe state: {new_state!r}")
         if self._is_bulk(entry_id):
             _LOGGER.debug("Ignoring state change for bulk item %s", entry_id)
             return
+        rec = self._record_for(entry_id)
+        if rec["state"] == new_state:
+            # Nothing changes — skip the save, listener fan-out and event.
+            # Re-wears while already ``worn`` go through async_record_wear.
+            return
 
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
         old_state = rec["state"]
-        same_state = old_state == new_state
-        now_iso = dt_util.utcnow().isoformat()
+        now_iso = _utcnow_iso()
 
         rec["state"] = new_state
-        if not same_state:
-            rec["state_changed_at"] = now_iso
+        rec["state_changed_at"] = now_iso
 
         crossed_threshold = False
-        if new_state == WardrobeState.WORN.value and not same_state:
+        if new_state == _STATE_WORN:
             rec["wears_since_wash"] = int(rec["wears_since_wash"]) + 1
             rec["wear_count_total"] = int(rec["wear_count_total"]) + 1
             rec["last_worn_at"] = now_iso
@@ -438,8 +603,8 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         ``EVENT_STATE_CHANGED`` with ``old_state == new_state`` so automations
         can react to re-wears.
         """
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
-        now_iso = dt_util.utcnow().isoformat()
+        rec = self._record_for(entry_id)
+        now_iso = _utcnow_iso()
         rec["wears_since_wash"] = int(rec["wears_since_wash"]) + 1
         rec["wear_count_total"] = int(rec["wear_count_total"]) + 1
         rec["last_worn_at"] = now_iso
@@ -454,19 +619,19 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         if self._is_bulk(entry_id):
             _LOGGER.debug("Ignoring mark_worn for bulk item %s", entry_id)
             return
-        if self.get_state(entry_id) == WardrobeState.WORN.value:
+        if self.get_state(entry_id) == _STATE_WORN:
             await self.async_record_wear(entry_id)
         else:
-            await self.async_set_state(entry_id, WardrobeState.WORN.value)
+            await self.async_set_state(entry_id, _STATE_WORN)
 
     async def async_mark_washed(self, entry_id: str) -> None:
         """Mark an item as freshly washed regardless of its current state."""
         if self._is_bulk(entry_id):
             await self.async_bulk_mark_washed(entry_id)
             return
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
+        rec = self._record_for(entry_id)
         old_state = rec["state"]
-        now_iso = dt_util.utcnow().isoformat()
+        now_iso = _utcnow_iso()
 
         rec["state"] = DEFAULT_STATE
         if old_state != DEFAULT_STATE:
@@ -489,30 +654,29 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         if self._is_bulk(entry_id):
             _LOGGER.debug("Ignoring cycle_state for bulk item %s", entry_id)
             return self.get_state(entry_id)
-        current = self.get_state(entry_id)
-        threshold = self.get_threshold(entry_id)
-        if (
-            current == WardrobeState.WORN.value
-            and threshold > 0
-            and int(self.get_record(entry_id)["wears_since_wash"]) < threshold
-        ):
-            await self.async_record_wear(entry_id)
-            return current
-
-        new = next_state_in(self._cycle_for(entry_id), current)
+        # One record fetch serves the whole decision: the re-wear check is
+        # the common case for repeated scans, and it needs no record copy.
+        rec = self.data.get(entry_id)
+        current = DEFAULT_STATE if rec is None else rec["state"]
+        if rec is not None and current == _STATE_WORN:
+            threshold = self._threshold_of(entry_id, rec)
+            if threshold > 0 and int(rec["wears_since_wash"]) < threshold:
+                await self.async_record_wear(entry_id)
+                return current
+
+        new = next_state_for(self._extras_for(entry_id), current)
         await self.async_set_state(entry_id, new)
         return new
 
     async def async_reset_statistics(self, entry_id: str) -> None:
         """Zero all counters and timestamps, keeping the current state."""
-        rec = dict(self.data.get(entry_id) or _new_record())  # type: ignore[arg-type]
+        rec = self._record_for(entry_id)
         rec["wears_since_wash"] = 0
         rec["wear_count_total"] = 0
         rec["wash_count"] = 0
         rec["last_worn_at"] = None
         rec["last_washed_at"] = None
-        self.data[entry_id] = rec  # type: ignore[assignment]
-        await self._async_save()
+        self._schedule_save()
         self.async_set_updated_data(self.data)
 
     # ------------------------------------------------------------------
@@ -525,11 +689,7 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         Checking equality (not >=) fires the needs-wash event once per wash
         cycle instead of on every wear past the limit.
         """
-        threshold = (
-            int(rec["wear_threshold"])
-            if rec["wear_threshold"] is not None
-            else self._config_threshold(entry_id)
-        )
+        threshold = self._threshold_of(entry_id, rec)
         return threshold > 0 and int(rec["wears_since_wash"]) == threshold
 
     def _fire_needs_wash(self, entry_id: str, rec: WardrobeRecord) -> None:
@@ -550,9 +710,8 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
         old_state: str,
         new_state: str,
     ) -> None:
-        """Store the record, notify listeners and fire the state-changed event."""
-        self.data[entry_id] = rec  # type: ignore[assignment]
-        await self._async_save()
+        """Schedule a save, notify listeners and fire the state-changed event."""
+        self._schedule_save()
         self.async_set_updated_data(self.data)
 
         name = self._item_name(entry_id)
@@ -571,13 +730,16 @@ class WardrobeCoordinator(DataUpdateCoordinator[dict[str, WardrobeRecord]]):
                 ATTR_STATE_CHANGED_AT: rec["state_changed_at"],
             },
         )
-        _LOGGER.debug(
-            "Wardrobe: %s (%s) %s -> %s (wears=%d total=%d washes=%d)",
-            name,
-            entry_id,
-            old_state,
-            new_state,
-            rec["wears_since_wash"],
-            rec["wear_count_total"],
-            rec["wash_count"],
-        )
+        # Guarded: building the seven-argument tuple on every transition is
+        # wasted work when debug logging is off, which is the normal case.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Wardrobe: %s (%s) %s -> %s (wears=%d total=%d washes=%d)",
+                name,
+                entry_id,
+                old_state,
+                new_state,
+                rec["wears_since_wash"],
+                rec["wear_count_total"],
+                rec["wash_count"],
+            )
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any, Final
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -17,25 +21,35 @@ from .const import (
 from .coordinator import WardrobeCoordinator, WardrobeRecord
 
 
+# DeviceInfo per entry, shared by all ~11 of its entities instead of built
+# once each. Keyed on the entry's data mapping identity: config edits replace
+# entry.data wholesale, which invalidates the cached value naturally.
+_ITEM_DEVICE_INFO: dict[str, tuple[Mapping[str, Any], DeviceInfo]] = {}
+
+
 def item_device_info(entry: ConfigEntry) -> DeviceInfo:
-    """Build the DeviceInfo for a clothing-item entry."""
-    return DeviceInfo(
+    """Return the (shared) DeviceInfo for a clothing-item entry."""
+    cached = _ITEM_DEVICE_INFO.get(entry.entry_id)
+    if cached is not None and cached[0] is entry.data:
+        return cached[1]
+    info = DeviceInfo(
         identifiers={(DOMAIN, entry.entry_id)},
         name=entry.data[CONF_ITEM_NAME],
         manufacturer=entry.data.get(CONF_BRAND) or "Wardrobe",
         model=entry.data.get(CONF_CATEGORY) or "other",
     )
+    _ITEM_DEVICE_INFO[entry.entry_id] = (entry.data, info)
+    return info
 
 
-def hub_device_info() -> DeviceInfo:
-    """Build the DeviceInfo for the summary hub."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, SUMMARY_DEVICE_ID)},
-        name=SUMMARY_DEVICE_NAME,
-        manufacturer="Wardrobe",
-        model="Summary",
-        entry_type=DeviceEntryType.SERVICE,
-    )
+# The summary device never varies, so all hub entities share one instance.
+_HUB_DEVICE_INFO: Final = DeviceInfo(
+    identifiers={(DOMAIN, SUMMARY_DEVICE_ID)},
+    name=SUMMARY_DEVICE_NAME,
+    manufacturer="Wardrobe",
+    model="Summary",
+    entry_type=DeviceEntryType.SERVICE,
+)
 
 
 class WardrobeItemEntity(CoordinatorEntity[WardrobeCoordinator]):
@@ -55,16 +69,50 @@ class WardrobeItemEntity(CoordinatorEntity[WardrobeCoordinator]):
         self._attr_translation_key = key
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{key}"
         self._attr_device_info = item_device_info(entry)
+        # Snapshot of the record behind the last state write; records are
+        # mutated in place, so a copy (not a reference) is required.
+        self._last_record: WardrobeRecord | None = None
+        # Pinned reference to the item's live record. Mutations edit the
+        # record in place, so the reference stays current between updates;
+        # it is re-fetched on every coordinator update regardless.
+        self._live_record: WardrobeRecord | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this item's record actually changed.
+
+        Coordinator updates fan out to every item's entities, but most
+        updates concern one other item; comparing against the snapshot
+        skips the state-machine write for all bystanders.
+        """
+        rec = self._live_record = self.coordinator.data.get(self._entry.entry_id)
+        if rec is not None and rec == self._last_record:
+            return
+        self._last_record = None if rec is None else dict(rec)  # type: ignore[assignment]
+        super()._handle_coordinator_update()
 
     def _record(self) -> WardrobeRecord:
-        """Return the coordinator record for this item."""
-        return self.coordinator.get_record(self._entry.entry_id)
+        """Return the live coordinator record for this item (read-only).
+
+        Entities only ever read individual fields, and every state write
+        used to clone the whole record first — per property, per entity.
+        The pinned reference turns the common read into an attribute load;
+        unknown entries still get a defaults copy from the coordinator.
+        """
+        rec = self._live_record
+        if rec is None:
+            rec = self.coordinator.data.get(self._entry.entry_id)
+            if rec is None:
+                return self.coordinator.get_record(self._entry.entry_id)
+            self._live_record = rec
+        return rec
 
 
 class WardrobeHubEntity(CoordinatorEntity[WardrobeCoordinator]):
     """Base for summary-hub entities."""
 
     _attr_has_entity_name = True
+    _attr_device_info = _HUB_DEVICE_INFO
 
     def __init__(
         self,
@@ -80,4 +128,3 @@ class WardrobeHubEntity(CoordinatorEntity[WardrobeCoordinator]):
         super().__init__(coordinator)
         self._attr_translation_key = key
         self._attr_unique_id = f"{DOMAIN}_summary_{unique_suffix or key}"
-        self._attr_device_info = hub_device_info()
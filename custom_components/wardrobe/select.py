@@ -41,7 +41,7 @@ from .const import (
     SERVICE_SET_STATE,
     STATE_ICONS,
     is_bulk_entry,
-    selectable_states,
+    selectable_options,
 )
 from .coordinator import WardrobeCoordinator
 from .entity import WardrobeItemEntity
@@ -95,10 +95,12 @@ class WardrobeStateSelect(WardrobeItemEntity, SelectEntity):
         The current state is always included so an item stranded in a state
         whose extra was later disabled stays representable.
         """
-        opts = selectable_states(self._entry.data.get(CONF_EXTRA_STATES))
+        opts = selectable_options(self._entry.data.get(CONF_EXTRA_STATES))
         current = self.coordinator.get_state(self._entry.entry_id)
         if current not in opts:
-            opts = [*opts, current]
+            # Only stranded items pay for a fresh list; the shared cached
+            # one must never be mutated.
+            return [*opts, current]
         return opts
 
     @property
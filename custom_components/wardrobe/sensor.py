@@ -11,7 +11,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
@@ -52,16 +52,21 @@ async def async_setup_entry(
     coordinator: WardrobeCoordinator = hass.data[DOMAIN]["shared"]["coordinator"]
 
     if entry.data.get(CONF_KIND) == KIND_SUMMARY:
-        entities: list[SensorEntity] = [
-            WardrobeSummaryCountSensor(coordinator, state) for state in CORE_CYCLE
-        ]
-        entities.append(WardrobePipelineCountSensor(coordinator))
-        entities.append(WardrobeTotalItemsSensor(coordinator))
-        entities.append(WardrobeNeedsWashCountSensor(coordinator))
-        entities.extend(
-            WardrobeLaundryLoadSensor(coordinator, entry, lt) for lt in LAUNDRY_TYPES
+        async_add_entities(
+            [
+                *(
+                    WardrobeSummaryCountSensor(coordinator, state)
+                    for state in CORE_CYCLE
+                ),
+                WardrobePipelineCountSensor(coordinator),
+                WardrobeTotalItemsSensor(coordinator),
+                WardrobeNeedsWashCountSensor(coordinator),
+                *(
+                    WardrobeLaundryLoadSensor(coordinator, entry, lt)
+                    for lt in LAUNDRY_TYPES
+                ),
+            ]
         )
-        async_add_entities(entities)
         return
 
     item_entities: list[SensorEntity] = [
@@ -73,17 +78,21 @@ async def async_setup_entry(
         ),
         WardrobeTimestampSensor(coordinator, entry, "last_worn_at"),
         WardrobeTimestampSensor(coordinator, entry, "last_washed_at"),
-    ]
-    if not is_bulk_entry(entry.data):
         # Bulk items have no state machine, so per-cycle fields don't apply.
-        item_entities.extend(
-            [
+        *(
+            ()
+            if is_bulk_entry(entry.data)
+            else (
                 WardrobeCounterSensor(coordinator, entry, "wears_since_wash"),
                 WardrobeTimestampSensor(coordinator, entry, "state_changed_at"),
-            ]
-        )
-    if entry.data.get(CONF_PURCHASE_PRICE) is not None:
-        item_entities.append(WardrobeCostPerWearSensor(coordinator, entry))
+            )
+        ),
+        *(
+            (WardrobeCostPerWearSensor(coordinator, entry),)
+            if entry.data.get(CONF_PURCHASE_PRICE) is not None
+            else ()
+        ),
+    ]
     async_add_entities(item_entities)
 
 
@@ -126,6 +135,9 @@ class WardrobeTimestampSensor(WardrobeItemEntity, SensorEntity):
         """Initialize a timestamp sensor for one record field."""
         super().__init__(coordinator, entry, key)
         self._key = key
+        # The record stores the raw ISO string; HA reads native_value far
+        # more often than the field changes, so memoize the last parse.
+        self._parsed: tuple[str, datetime | None] | None = None
 
     @property
     def native_value(self) -> datetime | None:
@@ -133,7 +145,9 @@ class WardrobeTimestampSensor(WardrobeItemEntity, SensorEntity):
         raw = self._record()[self._key]  # type: ignore[literal-required]
         if not raw:
             return None
-        return dt_util.parse_datetime(raw)
+        if self._parsed is None or self._parsed[0] != raw:
+            self._parsed = (raw, dt_util.parse_datetime(raw))
+        return self._parsed[1]
 
 
 class WardrobeCostPerWearSensor(WardrobeItemEntity, SensorEntity):
@@ -174,18 +188,27 @@ class _HubSensorBase(WardrobeHubEntity, SensorEntity):
     # them; only the total-items sensor opts back in.
     _include_bulk = False
 
+    # Matches computed at most once per coordinator update: native_value and
+    # extra_state_attributes both read them during the same state write.
+    _matched: list[tuple[ConfigEntry, dict[str, Any]]] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached matches before the state write re-reads them."""
+        self._matched = None
+        super()._handle_coordinator_update()
+
     def _matching_entries(self) -> list[tuple[ConfigEntry, dict[str, Any]]]:
         """Yield (entry, record) pairs this sensor counts."""
-        out: list[tuple[ConfigEntry, dict[str, Any]]] = []
-        for entry_id, rec in self.coordinator.data.items():
-            entry = self.hass.config_entries.async_get_entry(entry_id)
-            if entry is None or entry.data.get(CONF_KIND) == KIND_SUMMARY:
-                continue
-            if not self._include_bulk and is_bulk_entry(entry.data):
-                continue
-            if self._matches(entry, rec):
-                out.append((entry, rec))
-        return out
+        matched = self._matched
+        if matched is None:
+            matched = self._matched = [
+                (entry, rec)
+                for entry, rec in self.coordinator.item_entries()
+                if (self._include_bulk or not is_bulk_entry(entry.data))
+                and self._matches(entry, rec)
+            ]
+        return matched
 
     def _matches(self, entry: ConfigEntry, rec: dict[str, Any]) -> bool:
         """Return True when the item belongs in this sensor's count."""
@@ -266,10 +289,7 @@ class WardrobeNeedsWashCountSensor(_HubSensorBase):
         super().__init__(coordinator, "summary_needs_washing", "needs_washing")
 
     def _matches(self, entry: ConfigEntry, rec: dict[str, Any]) -> bool:
-        threshold = self.coordinator.get_threshold(entry.entry_id)
-        if threshold <= 0 or rec["state"] in DIRTY_STATES:
-            return False
-        return int(rec["wears_since_wash"]) >= threshold
+        return self.coordinator.needs_washing(entry.entry_id)
 
 
 class WardrobeLaundryLoadSensor(_HubSensorBase):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from custom_components.wardrobe.const import (
     ALL_STATES,
     CORE_CYCLE,
@@ -11,7 +13,9 @@ from custom_components.wardrobe.const import (
     is_bulk_entry,
     load_size_key,
     load_threshold_for,
+    next_state_for,
     next_state_in,
+    selectable_options,
     selectable_states,
 )
 
@@ -50,11 +54,40 @@ def test_parked_states_never_join_the_cycle() -> None:
     assert next_state_in(cycle, "storage") == "clean"
 
 
+# Derived rather than hand-listed: the complement of the default cycle
+# covers every out-of-cycle state automatically, including any added later.
+_OUT_OF_CYCLE = sorted(set(ALL_STATES) - set(build_cycle()))
+
+
+@pytest.mark.parametrize("state", _OUT_OF_CYCLE)
+def test_out_of_cycle_states_return_to_clean(state: str) -> None:
+    assert next_state_in(build_cycle(), state) == "clean"
+    assert next_state_for(None, state) == "clean"
+
+
+def test_next_state_for_matches_next_state_in() -> None:
+    # The cached lookup must agree with the list-walking original for every
+    # extras combination and every possible current state.
+    for extras in ([], ["washing"], ["drying", "washing"], ["repair", "ironing"]):
+        cycle = build_cycle(extras)
+        for state in ALL_STATES:
+            assert next_state_for(extras, state) == next_state_in(cycle, state)
+
+
 def test_selectable_states_include_parked_extras() -> None:
     opts = selectable_states(["washing", "storage"])
     assert opts == ["clean", "worn", "laundry", "washing", "storage"]
 
 
+def test_selectable_options_matches_and_shares() -> None:
+    # Same contents as the uncached helper, input order notwithstanding...
+    assert selectable_options(["storage", "washing"]) == selectable_states(
+        ["washing", "storage"]
+    )
+    # ...and one shared list per combination.
+    assert selectable_options(["washing"]) is selectable_options(["washing"])
+
+
 def test_state_taxonomy_is_consistent() -> None:
     assert set(CORE_CYCLE) | set(EXTRA_STATES) == set(ALL_STATES)
     assert "worn" not in DIRTY_STATES
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 
-from custom_components.wardrobe.const import STORAGE_KEY
+from custom_components.wardrobe.const import DOMAIN, STORAGE_KEY
 
 from .helpers import coordinator_of, make_item
 
@@ -110,6 +111,10 @@ async def test_v4_storage_survives_roundtrip(hass: HomeAssistant, hass_storage)
     coordinator = coordinator_of(hass)
     await coordinator.async_mark_worn("entry-3")
 
+    # Writes are delayed/coalesced; the pending write flushes at shutdown.
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
     saved = hass_storage[STORAGE_KEY]
     assert saved["version"] == 4
     row = saved["data"]["entries"]["entry-3"]
@@ -117,3 +122,20 @@ async def test_v4_storage_survives_roundtrip(hass: HomeAssistant, hass_storage)
     assert row["wear_count_total"] == 1
     assert row["weight"] == 1.0
     assert row["dirty_count"] == 0
+
+
+async def test_pending_save_flushes_on_last_unload(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    await _setup(hass, "entry-4", name="Last Item")
+    await coordinator_of(hass).async_mark_worn("entry-4")
+
+    # Unloading the last entry (the auto-created hub included) tears down
+    # the shared coordinator; the delayed save must hit disk before the
+    # store instance holding it is dropped.
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    row = hass_storage[STORAGE_KEY]["data"]["entries"]["entry-4"]
+    assert row["state"] == "worn"